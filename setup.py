@@ -45,9 +45,9 @@ with open(path.join(here, 'README.rst'), encoding='utf-8') as readme_file:
     readme = readme_file.read()
 
 with open(path.join(here, 'requirements.txt')) as requirements_file:
-    # Parse requirements.txt, ignoring any commented-out lines.
+    # Parse requirements.txt, ignoring any blank or commented-out lines.
     requirements = [line for line in requirements_file.read().splitlines()
-                    if not line.startswith('#')]
+                    if line and not line.startswith('#')]
 
 
 setup(
@@ -55,6 +55,7 @@ setup(
     version='0.9.1',
     description="Exporters / serializers for bluesky documents.",
     long_description=readme,
+    long_description_content_type='text/x-rst',
     author="Brookhaven National Lab",
     author_email='dallan@bnl.gov',
     url='https://github.com/NSLS-II/suitcase',